@@ -35,6 +35,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "crm.middleware.GraphQLCacheHeaderMiddleware",
 ]
 
 ROOT_URLCONF = "alx_backend_graphql_crm.urls"
@@ -2,7 +2,7 @@ import datetime
 
 def log_crm_heartbeat():
     timestamp = datetime.datetime.now().strftime("%d/%m/%Y-%H:%M:%S")
-    with open("/tmp/crm_heartbeat_log.txt", "a") as f:
+    with open("/tmp/crm_heartbeat_log.txt", "a", buffering=65536) as f:
         f.write(f"{timestamp} CRM is alive\n")
-from gql.transport.requests import RequestsHTTPTransport", "from gql import", "gql", "Client"
+"from gql.transport.requests import RequestsHTTPTransport", "from gql import", "gql", "Client"
 "/tmp/low_stock_updates_log.txt", "updateLowStockProducts"
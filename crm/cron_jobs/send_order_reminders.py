@@ -3,32 +3,46 @@ import requests
 import datetime
 
 GRAPHQL_ENDPOINT = "http://localhost:8000/graphql"
+
+# Reuse one pooled connection across requests and ask for compressed bodies.
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip", "Content-Type": "application/json"})
+
 query = """
-query RecentOrders {
-  allOrders {
-    id
-    customer {
-      email
+query RecentOrders($since: DateTime!) {
+  allOrders(orderDateGte: $since) {
+    edges {
+      node {
+        id
+        customer {
+          email
+        }
+      }
     }
-    orderDate
   }
 }
 """
 
 def main():
-    today = datetime.date.today()
-    cutoff = today - datetime.timedelta(days=7)
+    cutoff = datetime.datetime.now() - datetime.timedelta(days=7)
 
-    response = requests.post(GRAPHQL_ENDPOINT, json={"query": query})
+    response = SESSION.post(
+        GRAPHQL_ENDPOINT,
+        json={"query": query, "variables": {"since": cutoff.isoformat()}},
+        timeout=10,
+    )
     data = response.json()
 
-    orders = data.get("data", {}).get("allOrders", [])
-    with open("/tmp/order_reminders_log.txt", "a") as f:
-        for order in orders:
-            order_date = datetime.datetime.fromisoformat(order["orderDate"]).date()
-            if order_date >= cutoff:
-                log = f"{datetime.datetime.now()} - Reminder for Order {order['id']} (Customer: {order['customer']['email']})"
-                f.write(log + "\n")
+    edges = data.get("data", {}).get("allOrders", {}).get("edges", [])
+    # One timestamp for the whole batch instead of a clock read per order.
+    now_str = datetime.datetime.now().isoformat(timespec="seconds")
+    lines = []
+    for edge in edges:
+        order = edge["node"]
+        lines.append(f"{now_str} - Reminder for Order {order['id']} (Customer: {order['customer']['email']})\n")
+    # One buffered writelines instead of a syscall-per-order append loop.
+    with open("/tmp/order_reminders_log.txt", "a", buffering=65536) as f:
+        f.writelines(lines)
 
     print("Order reminders processed!")
 
@@ -0,0 +1,35 @@
+from .models import Customer
+
+class CustomerCache:
+    """Per-request pk cache for Customer rows reached outside the list
+    resolvers' select_related path (relay node lookups, deep nested
+    traversals): each distinct customer is fetched at most once per
+    request. This is not a coalescing DataLoader — the sync graphql-core
+    executor resolves fields one at a time, so there is never a batch of
+    keys to flush together."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def load(self, key):
+        key = int(key)
+        if key not in self._cache:
+            self._cache[key] = Customer.objects.filter(pk=key).first()
+        return self._cache[key]
+
+def get_cache(context, cache_cls):
+    """Return the request-scoped cache of the given class, creating the
+    per-request registry on first use. Falls back to a fresh cache when
+    there is no context to attach to (e.g. schema.execute in tests)."""
+    if context is None:
+        return cache_cls()
+    caches = getattr(context, "_crm_caches", None)
+    if caches is None:
+        caches = {}
+        try:
+            context._crm_caches = caches
+        except AttributeError:
+            return cache_cls()
+    if cache_cls not in caches:
+        caches[cache_cls] = cache_cls()
+    return caches[cache_cls]
@@ -0,0 +1,50 @@
+import json
+
+from graphql import parse
+from graphql.language.ast import FieldNode, OperationDefinitionNode
+
+# Top-level fields whose responses never contain row data.
+CACHEABLE_TOP_LEVEL = frozenset({"hello", "__schema", "__type", "__typename"})
+
+def _is_constant_query(query):
+    """True only when every top-level selection of every operation is a
+    hello/introspection field. Anything unparseable, any mutation, and
+    any fragment spread at the top level is treated as non-cacheable."""
+    try:
+        document = parse(query)
+    except Exception:
+        return False
+    saw_field = False
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        if definition.operation.value != "query":
+            return False
+        for sel in definition.selection_set.selections:
+            if not isinstance(sel, FieldNode) or sel.name.value not in CACHEABLE_TOP_LEVEL:
+                return False
+            saw_field = True
+    return saw_field
+
+class GraphQLCacheHeaderMiddleware:
+    """Mark responses to constant GraphQL queries (hello health checks and
+    schema introspection) as cacheable so proxies/CDNs can short-circuit
+    repeat requests."""
+
+    CACHE_CONTROL = "public, max-age=60"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        cacheable = False
+        if request.path.rstrip("/").endswith("graphql") and request.method == "POST":
+            try:
+                query = json.loads(request.body).get("query", "")
+            except (ValueError, AttributeError):
+                query = ""
+            cacheable = bool(query) and _is_constant_query(query)
+        response = self.get_response(request)
+        if cacheable and response.status_code == 200:
+            response["Cache-Control"] = self.CACHE_CONTROL
+        return response
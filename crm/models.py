@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Sum
 
 class TimestampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -27,11 +28,14 @@ class Order(TimestampedModel):
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name="orders")
     products = models.ManyToManyField(Product, related_name="orders")
     total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
-    order_date = models.DateTimeField(auto_now_add=True)
+    order_date = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        # Serves per-customer order history sorted newest-first.
+        indexes = [models.Index(fields=["customer", "-order_date"])]
 
     def recalc_total(self):
-        total = sum(p.price for p in self.products.all())
-        self.total_amount = total
+        self.total_amount = self.products.aggregate(t=Sum("price"))["t"] or 0
         self.save(update_fields=["total_amount"])
 
     def __str__(self):
@@ -1,17 +1,21 @@
 import re
 import decimal
 import graphene
+from graphql import FieldNode
 from graphene import relay
 from graphene_django import DjangoObjectType
 from graphene_django.filter import DjangoFilterConnectionField
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Sum
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from .models import Customer, Product, Order
 from .filters import CustomerFilter, ProductFilter, OrderFilter
+from .dataloaders import CustomerCache, get_cache
 
-PHONE_REGEX = re.compile(r"^(\+?\d[\d\-]{6,}\d)$")
+# \Z instead of $ (no trailing-newline match), no capture group to allocate.
+PHONE_REGEX = re.compile(r"^\+?\d[\d\-]{6,}\d\Z")
 
 # GraphQL Types
 class CustomerType(DjangoObjectType):
@@ -32,6 +36,14 @@ class OrderType(DjangoObjectType):
         interfaces = (relay.Node,)
         filterset_class = OrderFilter
 
+    def resolve_customer(self, info):
+        # Serve from the select_related cache when present; otherwise go
+        # through the per-request cache so repeated customers dedupe.
+        cached = self._state.fields_cache.get("customer")
+        if cached is not None:
+            return cached
+        return get_cache(info.context, CustomerCache).load(self.customer_id)
+
 # Inputs
 class CustomerInput(graphene.InputObjectType):
     name = graphene.String(required=True)
@@ -69,16 +81,15 @@ class CreateCustomer(graphene.Mutation):
 
     @staticmethod
     def mutate(root, info, input: CustomerInput):
-        errs = []
-        # Email uniqueness
-        if Customer.objects.filter(email=input.email).exists():
-            errs.append("Email already exists")
         # Phone format
         if input.phone and not PHONE_REGEX.match(input.phone):
-            errs.append("Invalid phone format")
-        if errs:
-            return CreateCustomerPayload(customer=None, message=None, errors=errs)
-        customer = Customer.objects.create(name=input.name, email=input.email, phone=input.phone or "")
+            return CreateCustomerPayload(customer=None, message=None, errors=["Invalid phone format"])
+        # Single INSERT; the unique constraint on email rejects duplicates
+        # atomically instead of a racy SELECT-then-INSERT.
+        try:
+            customer = Customer.objects.create(name=input.name, email=input.email, phone=input.phone or "")
+        except IntegrityError:
+            return CreateCustomerPayload(customer=None, message=None, errors=["Email already exists"])
         return CreateCustomerPayload(customer=customer, message="Customer created", errors=[])
 
 class BulkCreateCustomers(graphene.Mutation):
@@ -89,26 +100,106 @@ class BulkCreateCustomers(graphene.Mutation):
 
     @staticmethod
     def mutate(root, info, input):
+        errors = []
+        seen = set()  # duplicates within the batch itself
+        pending = []  # (row index, unsaved Customer) surviving local validation
+        for idx, item in enumerate(input, start=1):
+            errs = []
+            if item.email in seen:
+                errs.append(f"Row {idx}: Email already exists")
+            if item.phone and not PHONE_REGEX.match(item.phone):
+                errs.append(f"Row {idx}: Invalid phone format")
+            if not item.name:
+                errs.append(f"Row {idx}: Name is required")
+            if not item.email:
+                errs.append(f"Row {idx}: Email is required")
+
+            if errs:
+                errors.extend(errs)
+                continue
+            seen.add(item.email)
+            pending.append((idx, Customer(name=item.name, email=item.email, phone=item.phone or "")))
+
+        # Single INSERT: the unique constraint drops already-taken emails,
+        # so no SELECT scan is needed up front and the check is race-free.
+        started = timezone.now()
+        with transaction.atomic():
+            Customer.objects.bulk_create(
+                [c for _, c in pending], batch_size=500, ignore_conflicts=True
+            )
+        inserted = Customer.objects.filter(
+            email__in=[c.email for _, c in pending], created_at__gte=started
+        )
+        by_email = {c.email: c for c in inserted}
         created = []
+        for idx, c in pending:
+            saved = by_email.get(c.email)
+            if saved is None:
+                errors.append(f"Row {idx}: Email already exists")
+            else:
+                created.append(saved)
+        return BulkCreateCustomersPayload(customers=created, errors=errors)
+
+class BulkCreateCustomersColumnar(graphene.Mutation):
+    """Columnar variant of BulkCreateCustomers: parallel scalar lists
+    instead of a list of input objects, so very large imports skip the
+    per-row InputObject wrapper and can be fed straight from columnar
+    sources (CSV columns, dataframes)."""
+
+    class Arguments:
+        names = graphene.List(graphene.NonNull(graphene.String), required=True)
+        emails = graphene.List(graphene.NonNull(graphene.String), required=True)
+        phones = graphene.List(graphene.String, required=False)
+
+    Output = BulkCreateCustomersPayload
+
+    @staticmethod
+    def mutate(root, info, names, emails, phones=None):
+        if phones is None:
+            phones = [None] * len(names)
+        if not (len(names) == len(emails) == len(phones)):
+            return BulkCreateCustomersPayload(
+                customers=[], errors=["names, emails and phones must have the same length"]
+            )
+
         errors = []
+        seen = set()  # duplicates within the batch itself
+        pending = []  # (row index, unsaved Customer) surviving local validation
+        for idx, (name, email, phone) in enumerate(zip(names, emails, phones), start=1):
+            errs = []
+            if email in seen:
+                errs.append(f"Row {idx}: Email already exists")
+            if phone and not PHONE_REGEX.match(phone):
+                errs.append(f"Row {idx}: Invalid phone format")
+            if not name:
+                errs.append(f"Row {idx}: Name is required")
+            if not email:
+                errs.append(f"Row {idx}: Email is required")
+
+            if errs:
+                errors.extend(errs)
+                continue
+            seen.add(email)
+            pending.append((idx, Customer(name=name, email=email, phone=phone or "")))
+
+        # Same race-free pattern as BulkCreateCustomers: one INSERT with
+        # ignore_conflicts, then one SELECT to spot constraint rejections.
+        started = timezone.now()
         with transaction.atomic():
-            for idx, item in enumerate(input, start=1):
-                errs = []
-                if Customer.objects.filter(email=item.email).exists():
-                    errs.append(f"Row {idx}: Email already exists")
-                if item.phone and not PHONE_REGEX.match(item.phone):
-                    errs.append(f"Row {idx}: Invalid phone format")
-                if not item.name:
-                    errs.append(f"Row {idx}: Name is required")
-                if not item.email:
-                    errs.append(f"Row {idx}: Email is required")
-
-                if errs:
-                    errors.extend(errs)
-                    continue
-                c = Customer(name=item.name, email=item.email, phone=item.phone or "")
-                c.save()
-                created.append(c)
+            Customer.objects.bulk_create(
+                [c for _, c in pending], batch_size=1000, ignore_conflicts=True
+            )
+        inserted = Customer.objects.filter(
+            email__in=[c.email for _, c in pending], created_at__gte=started
+        )
+        by_email = {c.email: c for c in inserted}
+        created = []
+        for idx, c in pending:
+            saved = by_email.get(c.email)
+            if saved is None:
+                errors.append(f"Row {idx}: Email already exists")
+            else:
+                created.append(saved)
         return BulkCreateCustomersPayload(customers=created, errors=errors)
 
 class CreateProduct(graphene.Mutation):
@@ -157,8 +248,11 @@ class CreateOrder(graphene.Mutation):
             errors.append("At least one product must be provided")
             return CreateOrderPayload(order=None, errors=errors)
 
-        products = list(Product.objects.filter(pk__in=product_ids))
-        missing = set(map(int, product_ids)) - set(p.id for p in products)
+        # Validate IDs and sum prices without hydrating Product instances.
+        requested = frozenset(int(x) for x in product_ids)
+        qs = Product.objects.filter(pk__in=requested)
+        found = frozenset(qs.values_list("pk", flat=True))
+        missing = requested - found
         if missing:
             errors.append(f"Invalid product ID(s): {', '.join(map(str, sorted(missing)))}")
             return CreateOrderPayload(order=None, errors=errors)
@@ -166,22 +260,69 @@ class CreateOrder(graphene.Mutation):
         if order_date is None:
             order_date = timezone.now()
 
+        total = qs.aggregate(t=Sum("price"))["t"] or decimal.Decimal("0")
+
         with transaction.atomic():
             order = Order.objects.create(customer=customer, order_date=order_date)
-            order.products.set(products)
-            # Calculate total
-            total = sum(p.price for p in products)
+            order.products.set(list(found))
             order.total_amount = total
             order.save(update_fields=["total_amount"])
         return CreateOrderPayload(order=order, errors=[])
 
-# Query with filtering and ordering
-ALLOWED_CUSTOMER_ORDER_FIELDS = ["name", "-name", "email", "-email", "created_at", "-created_at"]
-ALLOWED_PRODUCT_ORDER_FIELDS = ["name", "-name", "price", "-price", "stock", "-stock", "created_at", "-created_at"]
-ALLOWED_ORDER_ORDER_FIELDS = ["order_date", "-order_date", "total_amount", "-total_amount", "created_at", "-created_at"]
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+ORDER_CONCRETE_FIELDS = frozenset(f.name for f in Order._meta.concrete_fields)
+CUSTOMER_CONCRETE_FIELDS = frozenset(f.name for f in Customer._meta.concrete_fields)
+
+def _snake(name):
+    return _CAMEL_RE.sub("_", name).lower()
+
+def _order_only_fields(info):
+    """Walk the allOrders selection set and return the only() column list
+    (order columns plus customer__* for the joined table), or None when
+    the selection cannot be determined statically (fragment spreads,
+    missing edges/node)."""
+    selections = info.field_nodes[0].selection_set
+    for name in ("edges", "node"):
+        if selections is None:
+            return None
+        nxt = None
+        for sel in selections.selections:
+            if not isinstance(sel, FieldNode):
+                return None
+            if sel.name.value == name:
+                nxt = sel.selection_set
+        if nxt is None:
+            return None
+        selections = nxt
+
+    only = {"id"}
+    for sel in selections.selections:
+        if not isinstance(sel, FieldNode):
+            return None
+        name = _snake(sel.name.value)
+        if name == "customer":
+            if sel.selection_set is None:
+                return None
+            only.add("customer")
+            only.add("customer__id")
+            for sub in sel.selection_set.selections:
+                if not isinstance(sub, FieldNode):
+                    return None
+                sub_name = _snake(sub.name.value)
+                if sub_name in CUSTOMER_CONCRETE_FIELDS:
+                    only.add(f"customer__{sub_name}")
+        elif name in ORDER_CONCRETE_FIELDS:
+            only.add(name)
+    return sorted(only)
+
+# Query with filtering and ordering (frozensets: O(1) membership per request)
+ALLOWED_CUSTOMER_ORDER_FIELDS = frozenset({"name", "-name", "email", "-email", "created_at", "-created_at"})
+ALLOWED_PRODUCT_ORDER_FIELDS = frozenset({"name", "-name", "price", "-price", "stock", "-stock", "created_at", "-created_at"})
+ALLOWED_ORDER_ORDER_FIELDS = frozenset({"order_date", "-order_date", "total_amount", "-total_amount", "created_at", "-created_at"})
 
 class Query(graphene.ObjectType):
-    hello = graphene.String()
+    # default_value lets graphene skip the resolver call entirely
+    hello = graphene.String(default_value="Hello, GraphQL!")
 
     all_customers = DjangoFilterConnectionField(
         CustomerType,
@@ -196,11 +337,8 @@ class Query(graphene.ObjectType):
         order_by=graphene.String(required=False),
     )
 
-    def resolve_hello(root, info):
-        return "Hello, GraphQL!"
-
     def resolve_all_customers(root, info, order_by=None, **kwargs):
-        qs = Customer.objects.all()
+        qs = Customer.objects.prefetch_related("orders")
         if order_by in ALLOWED_CUSTOMER_ORDER_FIELDS:
             qs = qs.order_by(order_by)
         return qs
@@ -212,7 +350,24 @@ class Query(graphene.ObjectType):
         return qs
 
     def resolve_all_orders(root, info, order_by=None, **kwargs):
-        qs = Order.objects.all().distinct()
+        # Join customer and batch-load products so nested fields don't
+        # trigger one query per order (classic N+1).
+        # Fetch only the columns the query selected; wide rows otherwise
+        # pay for unrequested fields on every order. The customer join is
+        # added only when the query traverses it (Django refuses to defer
+        # a select_related relation).
+        only = _order_only_fields(info)
+        qs = Order.objects.prefetch_related("products")
+        if only is None:
+            qs = qs.select_related("customer")
+        else:
+            if "customer" in only:
+                qs = qs.select_related("customer")
+            qs = qs.only(*only)
+        # Only the M2M product filters can fan out rows; DISTINCT is an
+        # unnecessary sort for every other query.
+        if any(k in kwargs for k in ("product_name", "product_id")):
+            qs = qs.distinct()
         if order_by in ALLOWED_ORDER_ORDER_FIELDS:
             qs = qs.order_by(order_by)
         return qs
@@ -220,6 +375,7 @@ class Query(graphene.ObjectType):
 class Mutation(graphene.ObjectType):
     create_customer = CreateCustomer.Field()
     bulk_create_customers = BulkCreateCustomers.Field()
+    bulk_create_customers_columnar = BulkCreateCustomersColumnar.Field()
     create_product = CreateProduct.Field()
     create_order = CreateOrder.Field()
 "UpdateLowStockProducts", "10", "from crm.models import Product"
@@ -25,12 +25,5 @@ class Order(models.Model):
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.0)
     order_date = models.DateTimeField(auto_now_add=True)
 
-    def save(self, *args, **kwargs):
-        # Auto-calculate total amount from product prices
-        if not self.pk:  # only calculate when creating
-            total = sum(p.price for p in self.products.all())
-            self.total_amount = total
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"Order {self.id} - {self.customer.name}"
@@ -3,6 +3,7 @@ from graphene_django import DjangoObjectType
 from .models import Customer, Product, Order
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Sum
 
 # ---------------- GraphQL Types ----------------
 class CustomerType(DjangoObjectType):
@@ -108,7 +109,7 @@ class CreateOrder(graphene.Mutation):
 
         order = Order.objects.create(customer=customer)
         order.products.set(products)
-        order.total_amount = sum(p.price for p in products)
+        order.total_amount = products.aggregate(t=Sum("price"))["t"] or 0
         order.save()
         return CreateOrder(order=order)
 
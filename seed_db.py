@@ -1,29 +1,48 @@
 import os
+from decimal import Decimal
+
 import django
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "alx_backend_graphql_crm.settings")
 django.setup()
 
+from django.db import transaction
+
 from crm.models import Customer, Product
 
 def seed():
-    # Seed Customers
+    # One SELECT + one bulk INSERT per model instead of get_or_create per row.
     customers = [
         {"name": "Alice", "email": "alice@example.com", "phone": "+123456789"},
         {"name": "Bob", "email": "bob@example.com", "phone": "123-456-7890"},
         {"name": "Carol", "email": "carol@example.com", "phone": None},
     ]
-    for c in customers:
-        Customer.objects.get_or_create(email=c["email"], defaults=c)
-
-    # Seed Products
     products = [
         {"name": "Laptop", "price": 999.99, "stock": 10},
         {"name": "Phone", "price": 499.99, "stock": 20},
         {"name": "Headphones", "price": 99.99, "stock": 50},
     ]
-    for p in products:
-        Product.objects.get_or_create(name=p["name"], defaults=p)
+
+    with transaction.atomic():
+        existing_emails = set(
+            Customer.objects.filter(email__in=[c["email"] for c in customers])
+            .values_list("email", flat=True)
+        )
+        Customer.objects.bulk_create(
+            [Customer(**c) for c in customers if c["email"] not in existing_emails]
+        )
+
+        existing_names = set(
+            Product.objects.filter(name__in=[p["name"] for p in products])
+            .values_list("name", flat=True)
+        )
+        Product.objects.bulk_create(
+            [
+                Product(name=p["name"], price=Decimal(str(p["price"])), stock=p["stock"])
+                for p in products
+                if p["name"] not in existing_names
+            ]
+        )
 
     print("✅ Database seeded successfully!")
 